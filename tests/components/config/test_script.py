@@ -1,6 +1,5 @@
 """Tests for config/script."""
 from http import HTTPStatus
-import json
 from typing import Any
 from unittest.mock import patch
 
@@ -27,21 +26,31 @@ async def setup_script(hass, script_config, stub_blueprint_populate):  # noqa: F
     assert await async_setup_component(hass, "script", {"script": script_config})
 
 
+@pytest.fixture(autouse=True)
+async def setup_config_script(hass, setup_script):
+    """Set up the config integration with only the script section."""
+    with patch.object(config, "SECTIONS", ["script"]):
+        await async_setup_component(hass, "config", {})
+
+
+@pytest.fixture
+def seeded_store(hass_config_store, request):
+    """Seed scripts.yaml in the config store."""
+    hass_config_store["scripts.yaml"] = request.param
+
+
 @pytest.mark.parametrize("script_config", ({},))
+@pytest.mark.parametrize(
+    "seeded_store",
+    ({"sun": {"alias": "Sun"}, "moon": {"alias": "Moon"}},),
+    indirect=True,
+)
 async def test_get_script_config(
-    hass: HomeAssistant, hass_client: ClientSessionGenerator, hass_config_store
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, seeded_store
 ) -> None:
     """Test getting script config."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
     client = await hass_client()
 
-    hass_config_store["scripts.yaml"] = {
-        "sun": {"alias": "Sun"},
-        "moon": {"alias": "Moon"},
-    }
-
     resp = await client.get("/api/config/script/config/moon")
 
     assert resp.status == HTTPStatus.OK
@@ -51,23 +60,25 @@ async def test_get_script_config(
 
 
 @pytest.mark.parametrize("script_config", ({},))
+@pytest.mark.parametrize(
+    "seeded_store",
+    ({"sun": {"alias": "Sun"}, "moon": {"alias": "Moon"}},),
+    indirect=True,
+)
 async def test_update_script_config(
-    hass: HomeAssistant, hass_client: ClientSessionGenerator, hass_config_store
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_config_store,
+    seeded_store,
 ) -> None:
     """Test updating script config."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     client = await hass_client()
 
-    orig_data = {"sun": {"alias": "Sun"}, "moon": {"alias": "Moon"}}
-    hass_config_store["scripts.yaml"] = orig_data
-
     resp = await client.post(
         "/api/config/script/config/moon",
-        data=json.dumps({"alias": "Moon updated", "sequence": []}),
+        json={"alias": "Moon updated", "sequence": []},
     )
     await hass.async_block_till_done()
     assert sorted(hass.states.async_entity_ids("script")) == [
@@ -87,6 +98,7 @@ async def test_update_script_config(
 
 
 @pytest.mark.parametrize("script_config", ({},))
+@pytest.mark.parametrize("seeded_store", ({"sun": {}, "moon": {}},), indirect=True)
 @pytest.mark.parametrize(
     ("updated_config", "validation_error"),
     [
@@ -117,27 +129,22 @@ async def test_update_script_config_with_error(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
     hass_config_store,
+    seeded_store,
     caplog: pytest.LogCaptureFixture,
     updated_config: Any,
     validation_error: str,
 ) -> None:
     """Test updating script config with errors."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     client = await hass_client()
 
-    orig_data = {"sun": {}, "moon": {}}
-    hass_config_store["scripts.yaml"] = orig_data
-
     resp = await client.post(
         "/api/config/script/config/moon",
-        data=json.dumps(updated_config),
+        json=updated_config,
     )
     await hass.async_block_till_done()
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     assert resp.status != HTTPStatus.OK
     result = await resp.json()
@@ -147,6 +154,7 @@ async def test_update_script_config_with_error(
 
 
 @pytest.mark.parametrize("script_config", ({},))
+@pytest.mark.parametrize("seeded_store", ({"sun": {}, "moon": {}},), indirect=True)
 @pytest.mark.parametrize(
     ("updated_config", "validation_error"),
     [
@@ -167,32 +175,27 @@ async def test_update_script_config_with_blueprint_substitution_error(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
     hass_config_store,
+    seeded_store,
     # setup_automation,
     caplog: pytest.LogCaptureFixture,
     updated_config: Any,
     validation_error: str,
 ) -> None:
     """Test updating script config with errors."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     client = await hass_client()
 
-    orig_data = {"sun": {}, "moon": {}}
-    hass_config_store["scripts.yaml"] = orig_data
-
     with patch(
         "homeassistant.components.blueprint.models.BlueprintInputs.async_substitute",
         side_effect=yaml.UndefinedSubstitution("blah"),
     ):
         resp = await client.post(
             "/api/config/script/config/moon",
-            data=json.dumps(updated_config),
+            json=updated_config,
         )
         await hass.async_block_till_done()
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     assert resp.status != HTTPStatus.OK
     result = await resp.json()
@@ -202,23 +205,25 @@ async def test_update_script_config_with_blueprint_substitution_error(
 
 
 @pytest.mark.parametrize("script_config", ({},))
+@pytest.mark.parametrize(
+    "seeded_store",
+    ({"sun": {"key": "value"}, "moon": {"key": "value"}},),
+    indirect=True,
+)
 async def test_update_remove_key_script_config(
-    hass: HomeAssistant, hass_client: ClientSessionGenerator, hass_config_store
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_config_store,
+    seeded_store,
 ) -> None:
     """Test updating script config while removing a key."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
-    assert sorted(hass.states.async_entity_ids("script")) == []
+    assert not hass.states.async_entity_ids("script")
 
     client = await hass_client()
 
-    orig_data = {"sun": {"key": "value"}, "moon": {"key": "value"}}
-    hass_config_store["scripts.yaml"] = orig_data
-
     resp = await client.post(
         "/api/config/script/config/moon",
-        data=json.dumps({"sequence": []}),
+        json={"sequence": []},
     )
     await hass.async_block_till_done()
     assert sorted(hass.states.async_entity_ids("script")) == [
@@ -246,13 +251,14 @@ async def test_update_remove_key_script_config(
         },
     ),
 )
+@pytest.mark.parametrize("seeded_store", ({"one": {}, "two": {}},), indirect=True)
 async def test_delete_script(
-    hass: HomeAssistant, hass_client: ClientSessionGenerator, hass_config_store
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_config_store,
+    seeded_store,
 ) -> None:
     """Test deleting a script."""
-    with patch.object(config, "SECTIONS", ["script"]):
-        await async_setup_component(hass, "config", {})
-
     assert sorted(hass.states.async_entity_ids("script")) == [
         "script.one",
         "script.two",
@@ -263,9 +269,6 @@ async def test_delete_script(
 
     client = await hass_client()
 
-    orig_data = {"one": {}, "two": {}}
-    hass_config_store["scripts.yaml"] = orig_data
-
     resp = await client.delete("/api/config/script/config/two")
     await hass.async_block_till_done()
 